@@ -1,8 +1,8 @@
 import asyncio
 import logging 
 import logging.config
-from database import db 
-from config import Config  
+from database import db
+from config import Config, temp
 from pyrogram import Client, __version__
 from pyrogram.raw.all import layer 
 from pyrogram.enums import ParseMode
@@ -34,6 +34,7 @@ class Bot(Client):
         self.username = me.username
         self.first_name = me.first_name
         self.set_parse_mode(ParseMode.DEFAULT)
+        temp.BANNED_USERS = set(await db.get_banned())
         text = "**๏[-ิ_•ิ]๏ bot restarted !**"
         logging.info(text)
         success = failed = 0
@@ -1,4 +1,5 @@
-from os import environ 
+from os import environ
+from cachetools import LRUCache, TTLCache
 
 class Config:
     API_ID = environ.get("API_ID", "22412440")
@@ -9,10 +10,14 @@ class Config:
     DATABASE_NAME = environ.get("DATABASE_NAME", "forward-bot")
     BOT_OWNER_ID = [int(id) for id in environ.get("BOT_OWNER_ID", '5505135072').split()]
 
-class temp(object): 
-    lock = {}
-    CANCEL = {}
+class Temp(object):
+    lock = LRUCache(maxsize=4096)
+    CANCEL = LRUCache(maxsize=4096)
+    CONFIGS = TTLCache(maxsize=10000, ttl=600)
+    busy = set()
     forwardings = 0
-    BANNED_USERS = []
+    BANNED_USERS = set()
     IS_FRWD_CHAT = []
-    
+
+temp = Temp()
+
@@ -1,22 +1,35 @@
-from os import environ 
+from os import environ
 from config import Config
 import motor.motor_asyncio
-from pymongo import MongoClient
+from cachetools import TTLCache
+from pymongo import MongoClient, UpdateOne
+
+_sync_client = None
 
 async def mongodb_version():
-    x = MongoClient(Config.DATABASE_URI)
-    mongodb_version = x.server_info()['version']
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = MongoClient(Config.DATABASE_URI)
+    mongodb_version = _sync_client.server_info()['version']
     return mongodb_version
 
 class Database:
-    
+
     def __init__(self, uri, database_name):
-        self._client = motor.motor_asyncio.AsyncIOMotorClient(uri)
+        self._client = motor.motor_asyncio.AsyncIOMotorClient(
+            uri,
+            maxPoolSize=200,
+            minPoolSize=10,
+            maxIdleTimeMS=300000,
+            waitQueueTimeoutMS=5000
+        )
         self.db = self._client[database_name]
         self.bot = self.db.bots
         self.col = self.db.users
         self.nfy = self.db.notify
-        self.chl = self.db.channels 
+        self.chl = self.db.channels
+        self.unq = self.db.unequify
+        self._bot_cache = TTLCache(maxsize=1000, ttl=60)
         
     def new_user(self, id, name):
         return dict(
@@ -69,8 +82,8 @@ class Database:
             return default
         return user.get('ban_status', default)
 
-    async def get_all_users(self):
-        return self.col.find({})
+    async def get_all_users(self, projection=None):
+        return self.col.find({}, projection).batch_size(1000)
     
     async def delete_user(self, user_id):
         await self.col.delete_many({'id': int(user_id)})
@@ -82,6 +95,19 @@ class Database:
 
     async def update_configs(self, id, configs):
         await self.col.update_one({'id': int(id)}, {'$set': {'configs': configs}})
+
+    async def bulk_update_configs(self, pairs):
+        ops = [UpdateOne({'id': int(uid)}, {'$set': {'configs': configs}}, upsert=True)
+               for uid, configs in pairs]
+        if ops:
+            await self.col.bulk_write(ops, ordered=False)
+
+    async def set_config_field(self, id, key, value, configs=None):
+        result = await self.col.update_one(
+            {'id': int(id), 'configs': {'$exists': True}},
+            {'$set': {f'configs.{key}': value}})
+        if result.matched_count == 0 and configs is not None:
+            await self.update_configs(id, configs)
          
     async def get_configs(self, id):
         default = {
@@ -115,12 +141,18 @@ class Database:
     async def add_bot(self, datas):
        if not await self.is_bot_exist(datas['user_id']):
           await self.bot.insert_one(datas)
-    
+       self._bot_cache.pop(int(datas['user_id']), None)
+
     async def remove_bot(self, user_id):
        await self.bot.delete_many({'user_id': int(user_id)})
-      
+       self._bot_cache.pop(int(user_id), None)
+
     async def get_bot(self, user_id: int):
-       bot = await self.bot.find_one({'user_id': user_id})
+       bot = self._bot_cache.get(int(user_id))
+       if bot is None:
+          bot = await self.bot.find_one({'user_id': int(user_id)})
+          if bot:
+             self._bot_cache[int(user_id)] = bot
        return bot if bot else None
                                           
     async def is_bot_exist(self, user_id):
@@ -158,6 +190,18 @@ class Database:
             filters.append(str(k))
        return filters
               
+    async def set_unequify_cursor(self, user_id, chat_id, offset):
+       await self.unq.update_one(
+           {'user_id': int(user_id), 'chat_id': str(chat_id)},
+           {'$set': {'offset': int(offset)}}, upsert=True)
+
+    async def get_unequify_cursor(self, user_id, chat_id):
+       cursor = await self.unq.find_one({'user_id': int(user_id), 'chat_id': str(chat_id)})
+       return cursor['offset'] if cursor else 0
+
+    async def clear_unequify_cursor(self, user_id, chat_id):
+       await self.unq.delete_many({'user_id': int(user_id), 'chat_id': str(chat_id)})
+
     async def add_frwd(self, user_id):
        return await self.nfy.insert_one({'user_id': int(user_id)})
     
@@ -7,7 +7,7 @@ from pyrogram.errors import InputUserDeactivated, FloodWait, UserIsBlocked
 
 @Client.on_message(filters.command("broadcast") & filters.user(Config.BOT_OWNER_ID) & filters.reply)
 async def broadcast (bot, message):
-    users = await db.get_all_users()
+    users = await db.get_all_users({'id': 1, '_id': 0})
     b_msg = message.reply_to_message
     sts = await message.reply_text(
         text='Broadcasting your messages...'
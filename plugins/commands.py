@@ -1,11 +1,11 @@
 import os
 import sys
 import asyncio 
-from database import db, mongodb_version
+from database import db
 from config import Config, temp
-from platform import python_version
+from .utils import render_status
 from translation import Translation
-from pyrogram import Client, filters, enums, __version__ as pyrogram_version
+from pyrogram import Client, filters, enums
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, InputMediaDocument
 
 main_buttons = [[
@@ -79,7 +79,7 @@ async def back(bot, query):
 @Client.on_callback_query(filters.regex(r'^about'))
 async def about(bot, query):
     await query.message.edit_text(
-        text=Translation.ABOUT_TXT.format(my_name='Public Forward',python_version=python_version(),pyrogram_version=pyrogram_version,mongodb_version=await mongodb_version()),
+        text=Translation.ABOUT_TXT,
         reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton('↩ Back', callback_data='back')]]),
         disable_web_page_preview=True,
         parse_mode=enums.ParseMode.HTML,
@@ -90,7 +90,7 @@ async def status(bot, query):
     users_count, bots_count = await db.total_users_bots_count()
     total_channels = await db.total_channels()
     await query.message.edit_text(
-        text=Translation.STATUS_TXT.format(users_count, bots_count, temp.forwardings, total_channels, temp.BANNED_USERS ),
+        text=render_status(users_count, bots_count, total_channels),
         reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton('↩ Back', callback_data='help')]]),
         parse_mode=enums.ParseMode.HTML,
         disable_web_page_preview=True,
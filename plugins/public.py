@@ -1,6 +1,6 @@
 import re
 import asyncio 
-from .utils import STS
+from .utils import STS, render_double_check
 from database import db
 from config import temp 
 from translation import Translation
@@ -80,7 +80,7 @@ async def run(bot, message):
     ]]
     reply_markup = InlineKeyboardMarkup(buttons)
     await message.reply_text(
-        text=Translation.DOUBLE_CHECK.format(botname=_bot['name'], botuname=_bot['username'], from_chat=title, to_chat=to_title, skip=skipno.text),
+        text=render_double_check(_bot['name'], _bot['username'], title, to_title, skipno.text),
         disable_web_page_preview=True,
         reply_markup=reply_markup
     )
@@ -1,18 +1,17 @@
-import os
-import sys 
+import html
 import math
 import time
-import asyncio 
+import asyncio
 import logging
-from .utils import STS
-from database import db 
+from .utils import STS, render_template
+from database import db
 from .test import CLIENT , start_clone_bot
-from config import Config, temp
+from config import temp
 from translation import Translation
-from pyrogram import Client, filters 
+from pyrogram import Client, filters
 #from pyropatch.utils import unpack_new_file_id
-from pyrogram.errors import FloodWait, MessageNotModified, RPCError
-from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery, Message 
+from pyrogram.errors import FloodWait, MessageNotModified
+from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 CLIENT = CLIENT()
 logger = logging.getLogger(__name__)
@@ -24,7 +23,7 @@ async def pub_(bot, message):
     user = message.from_user.id
     temp.CANCEL[user] = False
     frwd_id = message.data.split("_")[2]
-    if temp.lock.get(user) and str(temp.lock.get(user))=="True":
+    if temp.lock.get(user):
       return await message.answer("please wait until previous task complete", show_alert=True)
     sts = STS(frwd_id)
     if not sts.verify():
@@ -105,13 +104,14 @@ async def pub_(bot, message):
                    sts.add('total_files')
                    await asyncio.sleep(sleep) 
         except Exception as e:
-            await msg_edit(m, f'<b>ERROR:</b>\n<code>{e}</code>', wait=True)
+            await msg_edit(m, Translation.ERROR_FMT.format(error=html.escape(str(e))), wait=True)
             temp.IS_FRWD_CHAT.remove(sts.TO)
             return await stop(client, user)
         temp.IS_FRWD_CHAT.remove(sts.TO)
         await send(client, user, "<b>🎉 ғᴏʀᴡᴀᴅɪɴɢ ᴄᴏᴍᴘʟᴇᴛᴇᴅ 🥀 <a href=https://t.me/dev_gagan>SUPPORT</a>🥀</b>")
-        await edit(m, 'Completed', "completed", sts) 
+        await edit(m, 'Completed', "completed", sts)
         await stop(client, user)
+        sts.delete()
             
 async def copy(bot, msg, m, sts):
    try:                                  
@@ -131,9 +131,7 @@ async def copy(bot, msg, m, sts):
               reply_markup=msg.get('button'),
               protect_content=msg.get("protect"))
    except FloodWait as e:
-     await edit(m, 'Progressing', e.value, sts)
-     await asyncio.sleep(e.value)
-     await edit(m, 'Progressing', 10, sts)
+     await flood_pause(e, m, sts)
      await copy(bot, msg, m, sts)
    except Exception as e:
      print(e)
@@ -147,11 +145,14 @@ async def forward(bot, msg, m, sts, protect):
            protect_content=protect,
            message_ids=msg)
    except FloodWait as e:
-     await edit(m, 'Progressing', e.value, sts)
-     await asyncio.sleep(e.value)
-     await edit(m, 'Progressing', 10, sts)
+     await flood_pause(e, m, sts)
      await forward(bot, msg, m, sts, protect)
 
+async def flood_pause(e, m, sts):
+   await edit(m, 'Progressing', e.value, sts)
+   await asyncio.sleep(e.value)
+   await edit(m, 'Progressing', 10, sts)
+
 PROGRESS = """
 📈 Percetage: {0} %
 
@@ -194,7 +195,7 @@ async def edit(msg, title, status, sts):
    estimated_total_time = TimeFormatter(milliseconds=estimated_total_time)
    estimated_total_time = estimated_total_time if estimated_total_time != '' else '0 s'
 
-   text = TEXT.format(i.fetched, i.total_files, i.duplicate, i.deleted, i.skip, status, percentage, estimated_total_time, progress)
+   text = render_template(TEXT, i.fetched, i.total_files, i.duplicate, i.deleted, i.skip, status, percentage, estimated_total_time, progress)
    if status in ["cancelled", "completed"]:
       button.append(
          [InlineKeyboardButton('Support', url='https://t.me/dev_gagan'),
@@ -210,7 +211,8 @@ async def is_cancelled(client, user, msg, sts):
       await edit(msg, "Cancelled", "completed", sts)
       await send(client, user, "<b>❌ Forwarding Process Cancelled</b>")
       await stop(client, user)
-      return True 
+      sts.delete()
+      return True
    return False 
 
 async def stop(client, user):
@@ -286,7 +288,7 @@ async def status_msg(bot, msg):
     _, status, est_time, percentage, frwd_id = msg.data.split("#")
     sts = STS(frwd_id)
     if not sts.verify():
-       fetched, forwarded, remaining = 0
+       fetched = forwarded = remaining = 0
     else:
        fetched, forwarded = sts.get('fetched'), sts.get('total_files')
        remaining = fetched - forwarded 
@@ -1,29 +1,41 @@
-import asyncio 
+import asyncio
 from database import db
+from config import temp
 from translation import Translation
 from pyrogram import Client, filters
 from .test import get_configs, update_configs, CLIENT, parse_buttons
+from .utils import render_bot_details
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 CLIENT = CLIENT()
 
+MAIN_TEXT = "<b>change your settings as your wish</b>"
+UPDATED_TEXT = "<b>successfully updated</b>"
+CHANNEL_DETAILS_TEXT = "<b><u>📄 CHANNEL DETAILS</b></u>\n\n<b>- TITLE:</b> <code>{title}</code>\n<b>- CHANNEL ID: </b> <code>{chat_id}</code>\n<b>- USERNAME:</b> {username}"
+BACK_TO_MAIN_BTN = InlineKeyboardMarkup([[InlineKeyboardButton('↩ Back', callback_data="settings#main")]])
+MIN_FILE_SIZE_MB = 0
+MAX_FILE_SIZE_MB = 2000
+
 @Client.on_message(filters.command('settings'))
 async def settings(client, message):
+   if message.from_user.id in temp.BANNED_USERS:
+      return
    await message.delete()
    await message.reply_text(
-     "<b>change your settings as your wish</b>",
+     MAIN_TEXT,
      reply_markup=main_buttons()
      )
     
 @Client.on_callback_query(filters.regex(r'^settings'))
 async def settings_query(bot, query):
   user_id = query.from_user.id
-  i, type = query.data.split("#")
-  buttons = [[InlineKeyboardButton('↩ Back', callback_data="settings#main")]]
-  
+  if user_id in temp.BANNED_USERS:
+     return await query.answer("you are banned from using me", show_alert=True)
+  i, _, type = query.data.partition("#")
+
   if type=="main":
      await query.message.edit_text(
-       "<b>change your settings as your wish</b>",
+       MAIN_TEXT,
        reply_markup=main_buttons())
        
   elif type=="bots":
@@ -49,7 +61,7 @@ async def settings_query(bot, query):
      if bot != True: return
      await query.message.reply_text(
         "<b>bot token successfully added to db</b>",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        reply_markup=BACK_TO_MAIN_BTN)
   
   elif type=="adduserbot":
      await query.message.delete()
@@ -57,7 +69,7 @@ async def settings_query(bot, query):
      if user != True: return
      await query.message.reply_text(
         "<b>session successfully added to db</b>",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        reply_markup=BACK_TO_MAIN_BTN)
       
   elif type=="channels":
      buttons = []
@@ -82,7 +94,7 @@ async def settings_query(bot, query):
             await chat_ids.delete()
             return await text.edit_text(
                   "<b>process canceled</b>",
-                  reply_markup=InlineKeyboardMarkup(buttons))
+                  reply_markup=BACK_TO_MAIN_BTN)
          elif not chat_ids.forward_date:
             await chat_ids.delete()
             return await text.edit_text("**This is not a forward message**")
@@ -91,46 +103,46 @@ async def settings_query(bot, query):
             title = chat_ids.forward_from_chat.title
             username = chat_ids.forward_from_chat.username
             username = "@" + username if username else "private"
-         chat = await db.add_channel(user_id, chat_id, title, username)
-         await chat_ids.delete()
+         chat, _ = await asyncio.gather(
+            db.add_channel(user_id, chat_id, title, username),
+            chat_ids.delete())
          await text.edit_text(
             "<b>Successfully updated</b>" if chat else "<b>This channel already added</b>",
-            reply_markup=InlineKeyboardMarkup(buttons))
+            reply_markup=BACK_TO_MAIN_BTN)
      except asyncio.exceptions.TimeoutError:
-         await text.edit_text('Process has been automatically cancelled', reply_markup=InlineKeyboardMarkup(buttons))
+         await text.edit_text('Process has been automatically cancelled', reply_markup=BACK_TO_MAIN_BTN)
   
   elif type=="editbot": 
      bot = await db.get_bot(user_id)
-     TEXT = Translation.BOT_DETAILS if bot['is_bot'] else Translation.USER_DETAILS
      buttons = [[InlineKeyboardButton('❌ Remove ❌', callback_data=f"settings#removebot")
                ],
                [InlineKeyboardButton('↩ Back', callback_data="settings#bots")]]
      await query.message.edit_text(
-        TEXT.format(bot['name'], bot['id'], bot['username']),
+        render_bot_details(bot['name'], bot['id'], bot['username'], bot['is_bot']),
         reply_markup=InlineKeyboardMarkup(buttons))
                                              
   elif type=="removebot":
      await db.remove_bot(user_id)
      await query.message.edit_text(
-        "<b>successfully updated</b>",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        UPDATED_TEXT,
+        reply_markup=BACK_TO_MAIN_BTN)
                                              
-  elif type.startswith("editchannels"): 
-     chat_id = type.split('_')[1]
+  elif type.startswith("editchannels"):
+     chat_id = type.partition('_')[2]
      chat = await db.get_channel_details(user_id, chat_id)
      buttons = [[InlineKeyboardButton('❌ Remove ❌', callback_data=f"settings#removechannel_{chat_id}")
                ],
                [InlineKeyboardButton('↩ Back', callback_data="settings#channels")]]
      await query.message.edit_text(
-        f"<b><u>📄 CHANNEL DETAILS</b></u>\n\n<b>- TITLE:</b> <code>{chat['title']}</code>\n<b>- CHANNEL ID: </b> <code>{chat['chat_id']}</code>\n<b>- USERNAME:</b> {chat['username']}",
+        CHANNEL_DETAILS_TEXT.format_map(chat),
         reply_markup=InlineKeyboardMarkup(buttons))
                                              
   elif type.startswith("removechannel"):
-     chat_id = type.split('_')[1]
+     chat_id = type.partition('_')[2]
      await db.remove_channel(user_id, chat_id)
      await query.message.edit_text(
-        "<b>successfully updated</b>",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        UPDATED_TEXT,
+        reply_markup=BACK_TO_MAIN_BTN)
                                
   elif type=="caption":
      buttons = []
@@ -164,8 +176,8 @@ async def settings_query(bot, query):
   elif type=="deletecaption":
      await update_configs(user_id, 'caption', None)
      await query.message.edit_text(
-        "<b>successfully updated</b>",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        UPDATED_TEXT,
+        reply_markup=BACK_TO_MAIN_BTN)
                               
   elif type=="addcaption":
      await query.message.delete()
@@ -176,21 +188,22 @@ async def settings_query(bot, query):
             await caption.delete()
             return await text.edit_text(
                   "<b>process canceled !</b>",
-                  reply_markup=InlineKeyboardMarkup(buttons))
+                  reply_markup=BACK_TO_MAIN_BTN)
          try:
             caption.text.format(filename='', size='', caption='')
          except KeyError as e:
             await caption.delete()
             return await text.edit_text(
                f"<b>wrong filling {e} used in your caption. change it</b>",
-               reply_markup=InlineKeyboardMarkup(buttons))
-         await update_configs(user_id, 'caption', caption.text)
-         await caption.delete()
+               reply_markup=BACK_TO_MAIN_BTN)
+         await asyncio.gather(
+            update_configs(user_id, 'caption', caption.text),
+            caption.delete())
          await text.edit_text(
-            "<b>successfully updated</b>",
-            reply_markup=InlineKeyboardMarkup(buttons))
+            UPDATED_TEXT,
+            reply_markup=BACK_TO_MAIN_BTN)
      except asyncio.exceptions.TimeoutError:
-         await text.edit_text('Process has been automatically cancelled', reply_markup=InlineKeyboardMarkup(buttons))
+         await text.edit_text('Process has been automatically cancelled', reply_markup=BACK_TO_MAIN_BTN)
   
   elif type=="button":
      buttons = []
@@ -218,12 +231,13 @@ async def settings_query(bot, query):
          if not button:
             await ask.delete()
             return await txt.edit_text("**INVALID BUTTON**")
-         await update_configs(user_id, 'button', ask.text.html)
-         await ask.delete()
+         await asyncio.gather(
+            update_configs(user_id, 'button', ask.text.html),
+            ask.delete())
          await txt.edit_text("**Successfully button added**",
-            reply_markup=InlineKeyboardMarkup(buttons))
+            reply_markup=BACK_TO_MAIN_BTN)
      except asyncio.exceptions.TimeoutError:
-         await txt.edit_text('Process has been automatically cancelled', reply_markup=InlineKeyboardMarkup(buttons))
+         await txt.edit_text('Process has been automatically cancelled', reply_markup=BACK_TO_MAIN_BTN)
   
   elif type=="seebutton":
       button = (await get_configs(user_id))['button']
@@ -237,7 +251,7 @@ async def settings_query(bot, query):
      await update_configs(user_id, 'button', None)
      await query.message.edit_text(
         "**Successfully button deleted**",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        reply_markup=BACK_TO_MAIN_BTN)
    
   elif type=="database":
      buttons = []
@@ -262,13 +276,13 @@ async def settings_query(bot, query):
      if uri.text=="/cancel":
         return await uri.reply_text(
                   "<b>process canceled !</b>",
-                  reply_markup=InlineKeyboardMarkup(buttons))
+                  reply_markup=BACK_TO_MAIN_BTN)
      if not uri.text.startswith("mongodb+srv://") and not uri.text.endswith("majority"):
         return await uri.reply("<b>Invalid Mongodb Url</b>",
-                   reply_markup=InlineKeyboardMarkup(buttons))
+                   reply_markup=BACK_TO_MAIN_BTN)
      await update_configs(user_id, 'db_uri', uri.text)
      await uri.reply("**Successfully database url added**",
-             reply_markup=InlineKeyboardMarkup(buttons))
+             reply_markup=BACK_TO_MAIN_BTN)
   
   elif type=="seeurl":
      db_uri = (await get_configs(user_id))['db_uri']
@@ -278,7 +292,7 @@ async def settings_query(bot, query):
      await update_configs(user_id, 'db_uri', None)
      await query.message.edit_text(
         "**Successfully your database url deleted**",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        reply_markup=BACK_TO_MAIN_BTN)
       
   elif type=="filters":
      await query.message.edit_text(
@@ -291,15 +305,16 @@ async def settings_query(bot, query):
    
   elif type.startswith("updatefilter"):
      i, key, value = type.split('-')
+     configs = await get_configs(user_id)
      if value=="True":
         await update_configs(user_id, key, False)
      else:
         await update_configs(user_id, key, True)
      if key in ['poll', 'protect']:
         return await query.edit_message_reply_markup(
-           reply_markup=await next_filters_buttons(user_id)) 
+           reply_markup=await next_filters_buttons(user_id, configs))
      await query.edit_message_reply_markup(
-        reply_markup=await filters_buttons(user_id))
+        reply_markup=await filters_buttons(user_id, configs))
    
   elif type.startswith("file_size"):
     settings = await get_configs(user_id)
@@ -311,10 +326,11 @@ async def settings_query(bot, query):
   
   elif type.startswith("update_size"):
     size = int(query.data.split('-')[1])
-    if 0 < size > 2000:
+    if not MIN_FILE_SIZE_MB <= size <= MAX_FILE_SIZE_MB:
       return await query.answer("size limit exceeded", show_alert=True)
+    settings = await get_configs(user_id)
     await update_configs(user_id, 'file_size', size)
-    i, limit = size_limit((await get_configs(user_id))['size_limit'])
+    i, limit = size_limit(settings['size_limit'])
     await query.message.edit_text(
        f'<b><u>SIZE LIMIT</b></u><b>\n\nyou can set file size limit to forward\n\nStatus: files with {limit} `{size} MB` will forward</b>',
        reply_markup=size_button(size))
@@ -333,18 +349,17 @@ async def settings_query(bot, query):
     if ext.text == '/cancel':
        return await ext.reply_text(
                   "<b>process canceled</b>",
-                  reply_markup=InlineKeyboardMarkup(buttons))
+                  reply_markup=BACK_TO_MAIN_BTN)
     extensions = ext.text.split(" ")
     extension = (await get_configs(user_id))['extension']
     if extension:
-        for extn in extensions:
-            extension.append(extn)
+        extension = list(dict.fromkeys(extension + extensions))
     else:
         extension = extensions
     await update_configs(user_id, 'extension', extension)
     await ext.reply_text(
         f"**successfully updated**",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        reply_markup=BACK_TO_MAIN_BTN)
       
   elif type == "get_extension":
     extensions = (await get_configs(user_id))['extension']
@@ -359,25 +374,24 @@ async def settings_query(bot, query):
   elif type == "rmve_all_extension":
     await update_configs(user_id, 'extension', None)
     await query.message.edit_text(text="**successfully deleted**",
-                                   reply_markup=InlineKeyboardMarkup(buttons))
+                                   reply_markup=BACK_TO_MAIN_BTN)
   elif type == "add_keyword":
     await query.message.delete()
     ask = await bot.ask(user_id, text="**please send the keywords (seperete by space)**")
     if ask.text == '/cancel':
        return await ask.reply_text(
                   "<b>process canceled</b>",
-                  reply_markup=InlineKeyboardMarkup(buttons))
+                  reply_markup=BACK_TO_MAIN_BTN)
     keywords = ask.text.split(" ")
     keyword = (await get_configs(user_id))['keywords']
     if keyword:
-        for word in keywords:
-            keyword.append(word)
+        keyword = list(dict.fromkeys(keyword + keywords))
     else:
         keyword = keywords
     await update_configs(user_id, 'keywords', keyword)
     await ask.reply_text(
         f"**successfully updated**",
-        reply_markup=InlineKeyboardMarkup(buttons))
+        reply_markup=BACK_TO_MAIN_BTN)
   
   elif type == "get_keyword":
     keywords = (await get_configs(user_id))['keywords']
@@ -392,9 +406,9 @@ async def settings_query(bot, query):
   elif type == "rmve_all_keyword":
     await update_configs(user_id, 'keywords', None)
     await query.message.edit_text(text="**successfully deleted**",
-                                   reply_markup=InlineKeyboardMarkup(buttons))
+                                   reply_markup=BACK_TO_MAIN_BTN)
   elif type.startswith("alert"):
-    alert = type.split('_')[1]
+    alert = type.partition('_')[2]
     await query.answer(alert, show_alert=True)
       
 def main_buttons():
@@ -484,8 +498,8 @@ def size_button(size):
      ]]
   return InlineKeyboardMarkup(buttons)
        
-async def filters_buttons(user_id):
-  filter = await get_configs(user_id)
+async def filters_buttons(user_id, config=None):
+  filter = config or await get_configs(user_id)
   filters = filter['filters']
   buttons = [[
        InlineKeyboardButton('🏷️ Forward tag',
@@ -543,8 +557,8 @@ async def filters_buttons(user_id):
        ]]
   return InlineKeyboardMarkup(buttons) 
 
-async def next_filters_buttons(user_id):
-  filter = await get_configs(user_id)
+async def next_filters_buttons(user_id, config=None):
+  filter = config or await get_configs(user_id)
   filters = filter['filters']
   buttons = [[
        InlineKeyboardButton('📊 Poll',
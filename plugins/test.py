@@ -1,18 +1,12 @@
-import os
-import re 
-import sys
-import typing
-import asyncio 
-import logging 
+import re
+import time
+import asyncio
+import logging
+import functools
 from database import db 
 from config import Config, temp
 from pyrogram import Client, filters
-from pyrogram.raw.all import layer
-from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup, CallbackQuery, Message 
-from pyrogram.errors.exceptions.bad_request_400 import AccessTokenExpired, AccessTokenInvalid
-from pyrogram.errors import FloodWait
-from config import Config
-from translation import Translation
+from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 from typing import Union, Optional, AsyncGenerator
 
@@ -20,11 +14,16 @@ logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 BTN_URL_REGEX = re.compile(r"(\[([^\[]+?)]\[buttonurl:/{0,2}(.+?)(:same)?])")
+BOT_TOKEN_REGEX = re.compile(r"\b(\d{9,11}:[0-9A-Za-z_-]{35})(?![0-9A-Za-z_-])")
 BOT_TOKEN_TEXT = "<b>1) create a bot using @BotFather\n2) Then you will get a message with bot token\n3) Forward that message to me</b>"
 SESSION_STRING_SIZE = 351
+BOTFATHER_ID = 93372553
+TOPLEVEL_KEYS = frozenset({'caption', 'duplicate', 'db_uri', 'forward_tag', 'protect', 'file_size', 'size_limit', 'extension', 'keywords', 'button'})
 
 async def start_clone_bot(FwdBot, data=None):
    await FwdBot.start()
+   if getattr(FwdBot, "me", None) is None:
+      FwdBot.me = await FwdBot.get_me()
    #
    async def iter_messages(
       self, 
@@ -58,14 +57,29 @@ async def start_clone_bot(FwdBot, data=None):
                     print(message.text)
         """
         current = offset
-        while True:
-            new_diff = min(200, limit - current)
-            if new_diff <= 0:
-                return
-            messages = await self.get_messages(chat_id, list(range(current, current+new_diff+1)))
-            for message in messages:
-                yield message
-                current += 1
+        batch = min(200, limit - current)
+        if batch <= 0:
+            return
+        prefetch = asyncio.ensure_future(
+            self.get_messages(chat_id, list(range(current + 1, current + batch + 1))))
+        try:
+            while True:
+                messages = await prefetch
+                prefetch = None
+                current += batch
+                batch = min(200, limit - current)
+                if batch > 0:
+                    prefetch = asyncio.ensure_future(
+                        self.get_messages(chat_id, list(range(current + 1, current + batch + 1))))
+                for message in messages:
+                    yield message
+                if batch <= 0:
+                    return
+        finally:
+            # the consumer may abandon the generator mid-batch (e.g. on cancel);
+            # don't leave the speculative fetch pending on the clone client
+            if prefetch is not None and not prefetch.done():
+                prefetch.cancel()
    #
    FwdBot.iter_messages = iter_messages
    return FwdBot
@@ -91,10 +105,10 @@ class CLIENT:
         return await msg.reply('<b>process cancelled !</b>')
      elif not msg.forward_date:
        return await msg.reply_text("<b>This is not a forward message</b>")
-     elif str(msg.forward_from.id) != "93372553":
+     elif msg.forward_from.id != BOTFATHER_ID:
        return await msg.reply_text("<b>This message was not forward from bot father</b>")
-     bot_token = re.findall(r'\d[0-9]{8,10}:[0-9A-Za-z_-]{35}', msg.text, re.IGNORECASE)
-     bot_token = bot_token[0] if bot_token else None
+     bot_token = BOT_TOKEN_REGEX.search(msg.text)
+     bot_token = bot_token.group(1) if bot_token else None
      if not bot_token:
        return await msg.reply_text("<b>There is no bot token in that message</b>")
      try:
@@ -147,62 +161,89 @@ async def forward_tag(bot, m):
 
 @Client.on_message(filters.command('resetall') & filters.user(Config.BOT_OWNER_ID))
 async def resetall(bot, message):
-  users = await db.get_all_users()
+  users = await db.get_all_users({'id': 1, '_id': 0})
   sts = await message.reply("**processing**")
   TEXT = "total: {}\nsuccess: {}\nfailed: {}\nexcept: {}"
   total = success = failed = already = 0
   ERRORS = []
+  batch = []
+  last_edit = 0
   async for user in users:
       user_id = user['id']
       default = await get_configs(user_id)
       default['db_uri'] = None
+      temp.CONFIGS[user_id] = default
+      batch.append((user_id, default))
       total += 1
-      if total %10 == 0:
-         await sts.edit(TEXT.format(total, success, failed, already))
-      try: 
-         await db.update_configs(user_id, default)
-         success += 1
-      except Exception as e:
-         ERRORS.append(e)
-         failed += 1
+      if time.monotonic() - last_edit > 2:
+         last_edit = time.monotonic()
+         try:
+            await sts.edit(TEXT.format(total, success, failed, already))
+         except Exception:
+            pass
+      if len(batch) >= 500:
+         try:
+            await db.bulk_update_configs(batch)
+            success += len(batch)
+         except Exception as e:
+            ERRORS.append(e)
+            failed += len(batch)
+         batch = []
+  if batch:
+     try:
+        await db.bulk_update_configs(batch)
+        success += len(batch)
+     except Exception as e:
+        ERRORS.append(e)
+        failed += len(batch)
   if ERRORS:
      await message.reply(ERRORS[:100])
   await sts.edit("completed\n" + TEXT.format(total, success, failed, already))
   
 async def get_configs(user_id):
-  #configs = temp.CONFIGS.get(user_id)
-  #if not configs:
-  configs = await db.get_configs(user_id)
-  #temp.CONFIGS[user_id] = configs 
+  configs = temp.CONFIGS.get(user_id)
+  if not configs:
+     configs = await db.get_configs(user_id)
+     temp.CONFIGS[user_id] = configs
   return configs
-                          
+
 async def update_configs(user_id, key, value):
-  current = await db.get_configs(user_id)
-  if key in ['caption', 'duplicate', 'db_uri', 'forward_tag', 'protect', 'file_size', 'size_limit', 'extension', 'keywords', 'button']:
+  current = temp.CONFIGS.get(user_id)
+  if not current:
+     current = await db.get_configs(user_id)
+     temp.CONFIGS[user_id] = current
+  if key in TOPLEVEL_KEYS:
+     if current.get(key) == value:
+        return
      current[key] = value
-  else: 
+     dotted = key
+  else:
+     if current['filters'].get(key) == value:
+        return
      current['filters'][key] = value
- # temp.CONFIGS[user_id] = value
-  await db.update_configs(user_id, current)
+     dotted = f'filters.{key}'
+  await db.set_config_field(user_id, dotted, value, configs=current)
     
-def parse_buttons(text, markup=True):
-    buttons = []
+@functools.lru_cache(maxsize=1024)
+def _parse_button_rows(text):
+    if "buttonurl:" not in text:
+        return ()
+    rows = []
     for match in BTN_URL_REGEX.finditer(text):
-        n_escapes = 0
-        to_check = match.start(1) - 1
-        while to_check > 0 and text[to_check] == "\\":
-            n_escapes += 1
-            to_check -= 1
+        prefix = text[:match.start(1)]
+        n_escapes = len(prefix) - len(prefix.rstrip("\\"))
 
         if n_escapes % 2 == 0:
-            if bool(match.group(4)) and buttons:
-                buttons[-1].append(InlineKeyboardButton(
-                    text=match.group(2),
-                    url=match.group(3).replace(" ", "")))
+            if bool(match.group(4)) and rows:
+                rows[-1].append((match.group(2), match.group(3).replace(" ", "")))
             else:
-                buttons.append([InlineKeyboardButton(
-                    text=match.group(2),
-                    url=match.group(3).replace(" ", ""))])
-    if markup and buttons:
-       buttons = InlineKeyboardMarkup(buttons)
-    return buttons if buttons else None
+                rows.append([(match.group(2), match.group(3).replace(" ", ""))])
+    return tuple(tuple(row) for row in rows)
+
+def parse_buttons(text, markup=True):
+    rows = _parse_button_rows(text)
+    if not rows:
+       return None
+    buttons = [[InlineKeyboardButton(text=name, url=url) for name, url in row]
+               for row in rows]
+    return InlineKeyboardMarkup(buttons) if markup else buttons
@@ -1,13 +1,22 @@
-import re, asyncio
+import re, sys, html, time, asyncio
+from collections import OrderedDict
+from pybloom_live import ScalableBloomFilter
+from pyroaring import BitMap
 from database import db
 from config import temp
 from .test import CLIENT , start_clone_bot
+from .utils import async_antiflood
 from translation import Translation
-from pyrogram import Client, filters 
-#from pyropatch.utils import unpack_new_file_id
+from pyrogram import Client, enums, filters
+from pyrogram.errors import FloodWait
 from pyrogram.types import InlineKeyboardButton, InlineKeyboardMarkup
 
 CLIENT = CLIENT()
+LINK_REGEX = re.compile(r"(?:https?://)?(?:t\.me/|telegram\.(?:me|dog)/)(?:c/)?(\d+|[a-zA-Z_0-9]+)/(\d+)")
+BATCH_SIZE = 100
+DELETE_WORKERS = 4
+RECENT_CAPACITY = 50000
+
 COMPLETED_BTN = InlineKeyboardMarkup(
    [
       [InlineKeyboardButton('⚡ Support', url='https://t.me/dev_gagan')],
@@ -17,78 +26,141 @@ COMPLETED_BTN = InlineKeyboardMarkup(
 
 CANCEL_BTN = InlineKeyboardMarkup([[InlineKeyboardButton('• ᴄᴀɴᴄᴇʟ', 'terminate_frwd')]])
 
+async def _progress(sts, stats, stop_evt):
+   last = None
+   render = Translation.DUPLICATE_TEXT.format_map
+   while not stop_evt.is_set():
+      snap = (stats['total'], stats['deleted'], stats['state'])
+      if snap != last:
+         try:
+            await sts.edit(render(stats), reply_markup=CANCEL_BTN)
+         except Exception:
+            pass
+         last = snap
+      try:
+         await asyncio.wait_for(stop_evt.wait(), timeout=3)
+      except asyncio.TimeoutError:
+         pass
+
+async def _deleter(bot, chat_id, queue, stats):
+   while True:
+      batch = await queue.get()
+      if batch is None:
+         break
+      try:
+         result = await async_antiflood(bot.delete_messages, chat_id, batch)
+      except FloodWait:
+         continue
+      if result is not None:
+         stats['deleted'] += len(batch)
+
 @Client.on_message(filters.command("unequify") & filters.private)
 async def unequify(client, message):
    user_id = message.from_user.id
    temp.CANCEL[user_id] = False
-   if temp.lock.get(user_id) and str(temp.lock.get(user_id))=="True":
+   if user_id in temp.busy:
       return await message.reply("**please wait until previous task complete**")
-   _bot = await db.get_bot(user_id)
-   if not _bot or _bot['is_bot']:
-      return await message.reply("<b>Need userbot to do this process. Please add a userbot using /settings</b>")
-   target = await client.ask(user_id, text="**Forward the last message from target chat or send last message link.**\n/cancel - `cancel this process`")
-   if target.text.startswith("/"):
-      return await message.reply("**process cancelled !**")
-   elif target.text:
-      regex = re.compile(r"(https://)?(t\.me/|telegram\.me/|telegram\.dog/)(c/)?(\d+|[a-zA-Z_0-9]+)/(\d+)$")
-      match = regex.match(target.text.replace("?single", ""))
-      if not match:
-         return await message.reply('**Invalid link**')
-      chat_id = match.group(4)
-      last_msg_id = int(match.group(5))
-      if chat_id.isnumeric():
-         chat_id  = int(("-100" + chat_id))
-   elif fromid.forward_from_chat.type in ['channel', 'supergroup']:
-        last_msg_id = target.forward_from_message_id
-        chat_id = target.forward_from_chat.username or target.forward_from_chat.id
-   else:
-        return await message.reply_text("**invalid !**")
-   confirm = await client.ask(user_id, text="**send /yes to start the process and /no to cancel this process**")
-   if confirm.text.lower() == '/no':
-      return await confirm.reply("**process cancelled !**")
-   sts = await confirm.reply("`processing..`")
-   try:
-      bot = await start_clone_bot(CLIENT.client(_bot))
-   except Exception as e:
-      return await sts.edit(e)
-   try:
-       k = await bot.send_message(chat_id, text="testing")
-       await k.delete()
-   except:
-       await sts.edit(f"**please make your [userbot](t.me/{_bot['username']}) admin in target chat with full permissions**")
-       return await bot.stop()
-   MESSAGES = []
-   DUPLICATE = []
-   total=deleted=0
-   temp.lock[user_id] = True
+   temp.busy.add(user_id)
    try:
-     await sts.edit(Translation.DUPLICATE_TEXT.format(total, deleted, "ᴘʀᴏɢʀᴇssɪɴɢ"), reply_markup=CANCEL_BTN)
-     async for message in bot.search_messages(chat_id=chat_id, filter="document"):
-        if temp.CANCEL.get(user_id) == True:
-           await sts.edit(Translation.DUPLICATE_TEXT.format(total, deleted, "ᴄᴀɴᴄᴇʟʟᴇᴅ"), reply_markup=COMPLETED_BTN)
-           return await bot.stop()
-        file = message.document
-        file_id = unpack_new_file_id(file.file_id) 
-        if file_id in MESSAGES:
-           DUPLICATE.append(message.id)
-        else:
-           MESSAGES.append(file_id)
-        total += 1
-        if total %10000 == 0:
-           await sts.edit(Translation.DUPLICATE_TEXT.format(total, deleted, "ᴘʀᴏɢʀᴇssɪɴɢ"), reply_markup=CANCEL_BTN)
-        if len(DUPLICATE) >= 100:
-           await bot.delete_messages(chat_id, DUPLICATE)
-           deleted += 100
-           await sts.edit(Translation.DUPLICATE_TEXT.format(total, deleted, "ᴘʀᴏɢʀᴇssɪɴɢ"), reply_markup=CANCEL_BTN)
-           DUPLICATE = []
-     if DUPLICATE:
-        await bot.delete_messages(chat_id, DUPLICATE)
-        deleted += len(DUPLICATE)
-   except Exception as e:
-       temp.lock[user_id] = False 
-       await sts.edit(f"**ERROR**\n`{e}`")
-       return await bot.stop()
-   temp.lock[user_id] = False
-   await sts.edit(Translation.DUPLICATE_TEXT.format(total, deleted, "ᴄᴏᴍᴘʟᴇᴛᴇᴅ"), reply_markup=COMPLETED_BTN)
-   await bot.stop()
-   
+      _bot = await db.get_bot(user_id)
+      if not _bot or _bot['is_bot']:
+         return await message.reply("<b>Need userbot to do this process. Please add a userbot using /settings</b>")
+      target = await client.ask(user_id, text="**Forward the last message from target chat or send last message link.**\n/cancel - `cancel this process`")
+      if target.text.startswith("/"):
+         return await message.reply("**process cancelled !**")
+      elif target.text:
+         text = target.text
+         if "?single" in text:
+            text = text.replace("?single", "")
+         match = LINK_REGEX.fullmatch(text.strip())
+         if not match:
+            return await message.reply('**Invalid link**')
+         chat_id = match.group(1)
+         last_msg_id = int(match.group(2))
+         if chat_id.isnumeric():
+            chat_id  = int(("-100" + chat_id))
+      elif target.forward_from_chat and target.forward_from_chat.type in ['channel', 'supergroup']:
+           last_msg_id = target.forward_from_message_id
+           chat_id = target.forward_from_chat.username or target.forward_from_chat.id
+      else:
+           return await message.reply_text("**invalid !**")
+      confirm = await client.ask(user_id, text="**send /yes to start the process and /no to cancel this process**")
+      if confirm.text.lower() == '/no':
+         return await confirm.reply("**process cancelled !**")
+      sts = await confirm.reply("`processing..`")
+      try:
+         bot = await start_clone_bot(CLIENT.client(_bot))
+      except Exception as e:
+         return await sts.edit(e)
+      try:
+          member = await async_antiflood(bot.get_chat_member, chat_id, "me")
+          privileges = getattr(member, 'privileges', None)
+          can_delete = member is not None and (
+             member.status == enums.ChatMemberStatus.OWNER
+             or (privileges is not None and privileges.can_delete_messages))
+      except Exception:
+          can_delete = False
+      if not can_delete:
+          await sts.edit(f"**please make your [userbot](t.me/{_bot['username']}) admin in target chat with full permissions**")
+          return await bot.stop()
+      offset = await db.get_unequify_cursor(user_id, chat_id)
+      seen = ScalableBloomFilter(initial_capacity=1000000, error_rate=0.00001)
+      recent = OrderedDict()
+      duplicates = BitMap()
+      stats = {'total': 0, 'deleted': 0, 'state': "ᴘʀᴏɢʀᴇssɪɴɢ"}
+      queue = asyncio.Queue(maxsize=8)
+      stop_evt = asyncio.Event()
+      cancelled = False
+      last_flush = time.monotonic()
+      seen_add = seen.add
+      cancel_get = temp.CANCEL.get
+      intern = sys.intern
+      try:
+        async with asyncio.TaskGroup() as tg:
+           for _ in range(DELETE_WORKERS):
+              tg.create_task(_deleter(bot, chat_id, queue, stats))
+           tg.create_task(_progress(sts, stats, stop_evt))
+           try:
+              async for message in bot.search_messages(chat_id=chat_id, filter="document", offset=offset):
+                 if cancel_get(user_id) == True:
+                    cancelled = True
+                    break
+                 file_id = getattr(message.document, 'file_unique_id', None)
+                 if not file_id:
+                    stats['total'] += 1
+                    continue
+                 file_id = intern(file_id)
+                 if seen_add(file_id):
+                    if file_id in recent:
+                       duplicates.add(message.id)
+                 else:
+                    recent[file_id] = message.id
+                    if len(recent) > RECENT_CAPACITY:
+                       recent.popitem(last=False)
+                 stats['total'] += 1
+                 if stats['total'] % 10000 == 0:
+                    await db.set_unequify_cursor(user_id, chat_id, offset + stats['total'] - stats['deleted'])
+                 if len(duplicates) >= BATCH_SIZE or (duplicates and time.monotonic() - last_flush > 1.0):
+                    await queue.put(list(duplicates))
+                    duplicates = BitMap()
+                    last_flush = time.monotonic()
+              if duplicates and not cancelled:
+                 await queue.put(list(duplicates))
+           finally:
+              for _ in range(DELETE_WORKERS):
+                 await queue.put(None)
+              stop_evt.set()
+      except Exception as e:
+          if isinstance(e, ExceptionGroup):
+             e = e.exceptions[0]
+          await sts.edit(Translation.ERROR_FMT.format(error=html.escape(str(e))))
+          return await bot.stop()
+      if cancelled:
+         await db.set_unequify_cursor(user_id, chat_id, offset + stats['total'] - stats['deleted'])
+      else:
+         await db.clear_unequify_cursor(user_id, chat_id)
+      stats['state'] = "ᴄᴀɴᴄᴇʟʟᴇᴅ" if cancelled else "ᴄᴏᴍᴘʟᴇᴛᴇᴅ"
+      await sts.edit(Translation.DUPLICATE_TEXT.format_map(stats), reply_markup=COMPLETED_BTN)
+      await bot.stop()
+   finally:
+      temp.busy.discard(user_id)
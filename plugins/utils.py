@@ -1,8 +1,66 @@
+import random
+import string
+import asyncio
+import logging
+import functools
 import time as tm
-from database import db 
+from database import db
+from cachetools import TTLCache
+from translation import Translation
+from pyrogram.errors import FloodWait, RPCError
 from .test import parse_buttons
 
-STATUS = {}
+logger = logging.getLogger(__name__)
+
+STATUS = TTLCache(maxsize=10000, ttl=86400)
+MAX_FLOOD_WAIT_SECONDS = 600
+
+@functools.lru_cache(maxsize=64)
+def parse_template(template):
+    return tuple(string.Formatter().parse(template))
+
+def render_template(template, *args, **kwargs):
+    out = []
+    auto = 0
+    for literal, field, spec, conv in parse_template(template):
+        if literal:
+           out.append(literal)
+        if field is None:
+           continue
+        if field == '':
+           value, auto = args[auto], auto + 1
+        elif field.isdigit():
+           value = args[int(field)]
+        else:
+           value = kwargs[field]
+        out.append(value if isinstance(value, str) else str(value))
+    return ''.join(out)
+
+@functools.lru_cache(maxsize=256)
+def render_double_check(botname, botuname, from_chat, to_chat, skip):
+    return render_template(Translation.DOUBLE_CHECK, botname=botname, botuname=botuname,
+                           from_chat=from_chat, to_chat=to_chat, skip=skip)
+
+@functools.lru_cache(maxsize=64)
+def render_status(users, bots, channels):
+    return render_template(Translation.STATUS_TXT, users, bots, channels)
+
+@functools.lru_cache(maxsize=256)
+def render_bot_details(name, id, username, is_bot=True):
+    template = Translation.BOT_DETAILS if is_bot else Translation.USER_DETAILS
+    return render_template(template, name, id, username)
+
+async def async_antiflood(fn, *args, retries=5, **kwargs):
+    for i in range(retries):
+        try:
+            return await fn(*args, **kwargs)
+        except FloodWait as e:
+            if e.value > MAX_FLOOD_WAIT_SECONDS or i == retries - 1:
+                raise
+            await asyncio.sleep(max(e.value + 1, 2 ** i) + random.random())
+        except RPCError as e:
+            logger.error(f"{getattr(fn, '__name__', fn)}: {e}")
+            return None
 
 class STS:
     def __init__(self, id):
@@ -16,7 +74,7 @@ class STS:
         self.data[self.id] = {"FROM": From, 'TO': to, 'total_files': 0, 'skip': skip, 'limit': limit,
                       'fetched': skip, 'filtered': 0, 'deleted': 0, 'duplicate': 0, 'total': limit, 'start': 0}
         self.get(full=True)
-        return STS(self.id)
+        return self
         
     def get(self, value=None, full=False):
         values = self.data.get(self.id)
@@ -27,18 +85,25 @@ class STS:
         return self
 
     def add(self, key=None, value=1, time=False):
+        values = self.data[self.id]
         if time:
-          return self.data[self.id].update({'start': tm.time()})
-        self.data[self.id].update({key: self.get(key) + value}) 
+          values['start'] = tm.time()
+        else:
+          values[key] = values[key] + value
+        # reassign so the TTL clock restarts and an active job is never evicted
+        self.data[self.id] = values
     
+    def delete(self):
+        self.data.pop(self.id, None)
+
     def divide(self, no, by):
        by = 1 if int(by) == 0 else by 
        return int(no) / by 
     
     async def get_data(self, user_id):
-        bot = await db.get_bot(user_id)
-        k, filters = self, await db.get_filters(user_id)
-        size, configs = None, await db.get_configs(user_id)
+        bot, configs = await asyncio.gather(db.get_bot(user_id), db.get_configs(user_id))
+        k, size = self, None
+        filters = [str(key) for key, value in configs['filters'].items() if value == False]
         if configs['duplicate']:
            duplicate = [configs['db_uri'], self.TO]
         else:
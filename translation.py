@@ -1,113 +1,64 @@
 import os
+import sys
+import mmap
 from config import Config
+from platform import python_version
 
-class Translation(object):
-  START_TXT = """<b>ʜᴇʟʟᴏ {}</b>
+# long templates live in translation.dat as one utf-8 blob; _OFFSETS maps
+# each name to its (start, length) byte slice. regenerate both together
+# when editing a template.
+_DAT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translation.dat')
 
-<i>ɪ'ᴍ ᴀ <b>ᴘᴏᴡᴇʀғᴜʟʟ</b> ᴀᴜᴛᴏ ғᴏʀᴡᴀʀᴅ ʙᴏᴛ
+_OFFSETS = {
+    'START_TXT': (0, 403),
+    'HELP_TXT': (403, 758),
+    'HOW_USE_TXT': (1161, 386),
+    'STATUS_TXT': (1547, 226),
+    'TEXT': (1773, 601),
+    'TEXT1': (2374, 469),
+    'DUPLICATE_TEXT': (2843, 400),
+    'DOUBLE_CHECK': (3243, 565),
+}
 
-ɪ ᴄᴀɴ ғᴏʀᴡᴀʀᴅ ᴀʟʟ ᴍᴇssᴀɢᴇ ғʀᴏᴍ ᴏɴᴇ ᴄʜᴀɴɴᴇʟ ᴛᴏ ᴀɴᴏᴛʜᴇʀ ᴄʜᴀɴɴᴇʟ</i> <b>➜ ᴡɪᴛʜ ᴍᴏʀᴇ ғᴇᴀᴛᴜʀᴇs.
-ᴄʟɪᴄᴋ ʜᴇʟᴘ ʙᴜᴛᴛᴏɴ ᴛᴏ ᴋɴᴏᴡ ᴍᴏʀᴇ ᴀʙᴏᴜᴛ ᴍᴇ</b>"""
+_dat = None
 
-
-  HELP_TXT = """<b><u>🔆 HELP</b></u>
-
-<u>**📚 Available commands:**</u>
-<b>⏣ __/start - check I'm alive__ 
-⏣ __/forward - forward messages__
-⏣ __/unequify - delete duplicate messages in channels__
-⏣ __/settings - configure your settings__
-⏣ __/reset - reset your settings__</b>
-
-<b><u>💢 Features:</b></u>
-<b>► __Forward message from public channel to your channel without admin permission. if the channel is private need admin permission__
-► __Forward message from private channel to your channel by using userbot(user must be member in there)__
-► __custom caption__
-► __custom button__
-► __support restricted chats__
-► __skip duplicate messages__
-► __filter type of messages__
-► __skip messages based on extensions & keywords & size__</b>
-"""
-  
-  HOW_USE_TXT = """<b><u>⚠️ Before Forwarding:</b></u>
-<b>► __add a bot or userbot__
-► __add atleast one to channel__ `(your bot/userbot must be admin in there)`
-► __You can add chats or bots by using /settings__
-► __if the **From Channel** is private your userbot must be member in there or your bot must need admin permission in there also__
-► __Then use /forward to forward messages__</b>"""
-  
-  ABOUT_TXT = """<b>╭──────❰ 🤖 Bot Details ❱──────〄
-│ 
+ABOUT_TXT = """<b>╭──────❰ 🤖 Bot Details ❱──────〄
+│
 │ 🤖 Mʏ Nᴀᴍᴇ : <a href=https://t.me/devganbot>Dev Gagan Botᴛ</a>
 │ 👨‍💻 ᴅᴇᴠᴘʟᴏᴇʀ : <a href=https://t.me/dev_gagan>Team SPY</a>
 │ 🤖 ᴜᴘᴅᴀᴛᴇ  : <a href=https://t.me/dev_gagan>devgagan</a>
 │ 📡 ʜᴏsᴛ ᴏɴ : <a href=https://devgagan.in/>Dev Gagan Host</a>
-│ 🗣️ ʟᴀɴɢᴜᴀɢᴇ  : ᴘʏᴛʜᴏɴ 3 
-{python_version}
-│ 📚 ʟɪʙʀᴀʀʏ  : ᴘʏʀᴏɢʀᴀᴍ  
+│ 🗣️ ʟᴀɴɢᴜᴀɢᴇ  : ᴘʏᴛʜᴏɴ 3
+│ 🐍 ᴠᴇʀsɪᴏɴ : """ + python_version() + """
+│ 📚 ʟɪʙʀᴀʀʏ  : ᴘʏʀᴏɢʀᴀᴍ
 ╰────────────────────⍟</b>"""
-  
-  STATUS_TXT = """<b>╭──────❪ 🤖 Bot Status ❫─────⍟
-│
-├👨 ᴜsᴇʀs  : {}
-│
-├🤖 ʙᴏᴛs : {}
-│
-├📣 ᴄʜᴀɴɴᴇʟ  : {} 
-╰───────────────────⍟</b>""" 
-  
-  FROM_MSG = "<b>❪ SET SOURCE CHAT ❫\n\nForward the last message or last message link of source chat.\n/cancel - cancel this process</b>"
-  TO_MSG = "<b>❪ CHOOSE TARGET CHAT ❫\n\nChoose your target chat from the given buttons.\n/cancel - Cancel this process</b>"
-  SKIP_MSG = "<b>❪ SET MESSAGE SKIPING NUMBER ❫</b>\n\n<b>Skip the message as much as you enter the number and the rest of the message will be forwarded\nDefault Skip Number =</b> <code>0</code>\n<code>eg: You enter 0 = 0 message skiped\n You enter 5 = 5 message skiped</code>\n/cancel <b>- cancel this process</b>"
-  CANCEL = "<b>Process Cancelled Succefully !</b>"
-  BOT_DETAILS = "<b><u>📄 BOT DETAILS</b></u>\n\n<b>➣ NAME:</b> <code>{}</code>\n<b>➣ BOT ID:</b> <code>{}</code>\n<b>➣ USERNAME:</b> @{}"
-  USER_DETAILS = "<b><u>📄 USERBOT DETAILS</b></u>\n\n<b>➣ NAME:</b> <code>{}</code>\n<b>➣ USER ID:</b> <code>{}</code>\n<b>➣ USERNAME:</b> @{}"  
-         
-  TEXT = """<b>╭────❰ <u>Forwarded Status</u> ❱────❍
-┃
-┣⊸<b>🕵 ғᴇᴄʜᴇᴅ ᴍsɢ :</b> <code>{}</code>
-┣⊸<b>✅ sᴜᴄᴄᴇғᴜʟʟʏ ғᴡᴅ :</b> <code>{}</code>
-┣⊸<b>👥 ᴅᴜᴘʟɪᴄᴀᴛᴇ ᴍsɢ :</b> <code>{}</code>
-┣⊸<b>🗑️ ᴅᴇʟᴇᴛᴇᴅ ᴍsɢ :</b> <code>{}</code>
-┣⊸<b>🪆 sᴋɪᴘᴘᴇᴅ ᴍsɢ :</b> <code>{}</code>
-┣⊸<b>📊 sᴛᴀᴛᴜs  :</b> <code>{}</code>
-┣⊸<b>⏳ ᴘʀᴏɢʀᴇss  :</b> <code>{}</code> %
-┣⊸<b>⏰ ᴇᴛᴀ :</b> <code>{}</code>
-┃
-╰────⌊ <b>{}</b> ⌉───❍</b>"""
-
-  TEXT1 = """<b>╭─❰ <u>Forwarded Status</u> ❱─❍
-┃
-┣⊸🕵𝙁𝙚𝙘𝙝𝙚𝙙 𝙈𝙨𝙜 : {}
-┣⊸✅𝙎𝙪𝙘𝙘𝙚𝙛𝙪𝙡𝙮 𝙁𝙬𝙙 : {}
-┣⊸👥𝘿𝙪𝙥𝙡𝙞𝙘𝙖𝙩𝙚 𝙈𝙨𝙜: {}
-┣⊸🗑𝘿𝙚𝙡𝙚𝙩𝙚𝙙 𝙈𝙨𝙜: {}
-┣⊸🪆𝙎𝙠𝙞𝙥𝙥𝙚𝙙 : {}
-┣⊸📊𝙎𝙩𝙖𝙩𝙨 : {}
-┣⊸⏳𝙋𝙧𝙤𝙜𝙧𝙚𝙨𝙨 : {}
-┣⊸𝙀𝙏𝘼 : {}
-┃
-╰─⌊ {} ⌉─❍</b>"""
 
-  DUPLICATE_TEXT = """
-╔════❰ ᴜɴᴇǫᴜɪғʏ sᴛᴀᴛᴜs ❱═❍⊱❁۪۪
-║╭━━━━━━━━━━━━━━━➣
-║┣⪼ <b>ғᴇᴛᴄʜᴇᴅ ғɪʟᴇs:</b> <code>{}</code>
-║┃
-║┣⪼ <b>ᴅᴜᴘʟɪᴄᴀᴛᴇ ᴅᴇʟᴇᴛᴇᴅ:</b> <code>{}</code> 
-║╰━━━━━━━━━━━━━━━➣
-╚════❰ {} ❱══❍⊱❁۪۪
-"""
-  DOUBLE_CHECK = """<b><u>DOUBLE CHECKING ⚠️</b></u>
-<code>Before forwarding the messages Click the Yes button only after checking the following</code>
+CANCEL_CMD = "\n/cancel - cancel this process"
+FROM_MSG = "<b>❪ SET SOURCE CHAT ❫\n\nForward the last message or last message link of source chat." + CANCEL_CMD + "</b>"
+TO_MSG = "<b>❪ CHOOSE TARGET CHAT ❫\n\nChoose your target chat from the given buttons." + CANCEL_CMD + "</b>"
+SKIP_MSG = "<b>❪ SET MESSAGE SKIPING NUMBER ❫</b>\n\n<b>Skip the message as much as you enter the number and the rest of the message will be forwarded\nDefault Skip Number =</b> <code>0</code>\n<code>eg: You enter 0 = 0 message skiped\n You enter 5 = 5 message skiped</code><b>" + CANCEL_CMD + "</b>"
+CANCEL = "<b>Process Cancelled Succefully !</b>"
+BOT_DETAILS = "<b><u>📄 BOT DETAILS</b></u>\n\n<b>➣ NAME:</b> <code>{}</code>\n<b>➣ BOT ID:</b> <code>{}</code>\n<b>➣ USERNAME:</b> @{}"
+USER_DETAILS = "<b><u>📄 USERBOT DETAILS</b></u>\n\n<b>➣ NAME:</b> <code>{}</code>\n<b>➣ USER ID:</b> <code>{}</code>\n<b>➣ USERNAME:</b> @{}"
+ERROR_FMT = "<b>ERROR:</b>\n<code>{error}</code>"
 
-<b>★ YOUR BOT:</b> [{botname}](t.me/{botuname})
-<b>★ FROM CHANNEL:</b> `{from_chat}`
-<b>★ TO CHANNEL:</b> `{to_chat}`
-<b>★ SKIP MESSAGES:</b> `{skip}`
+_module = sys.modules[__name__]
+for _name, _value in list(vars(_module).items()):
+  if isinstance(_value, str) and not _name.startswith('_'):
+    setattr(_module, _name, sys.intern(_value))
+del _name, _value
 
-<i>° [{botname}](t.me/{botuname}) must be admin in **TARGET CHAT**</i> (`{to_chat}`)
-<i>° If the **SOURCE CHAT** is private your userbot must be member or your bot must be admin in there also</b></i>
+def __getattr__(name):
+  global _dat
+  try:
+    start, length = _OFFSETS[name]
+  except KeyError:
+    raise AttributeError(name) from None
+  if _dat is None:
+    with open(_DAT_PATH, 'rb') as f:
+      _dat = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+  value = sys.intern(_dat[start:start + length].decode('utf-8'))
+  setattr(_module, name, value)
+  return value
 
-<b>If the above is checked then the yes button can be clicked</b>"""
+Translation = _module